@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import importlib.util
 import sys
 
 
 def main():
-    try:
-        from . import qtapp
+    if importlib.util.find_spec("PySide6") is None:
+        print("PySide6 is not installed, using Tkinter GUI", file=sys.stderr)
+    else:
+        try:
+            from . import qtapp
 
-        return qtapp.run_qt()
-    except Exception as exc:  # noqa: BLE001
-        print(f"Falling back to Tkinter GUI: {exc}", file=sys.stderr)
-        from . import tkapp
+            return qtapp.run_qt()
+        except Exception as exc:  # noqa: BLE001
+            print(f"Falling back to Tkinter GUI: {exc}", file=sys.stderr)
+    from . import tkapp
 
-        return tkapp.run_tk()
+    return tkapp.run_tk()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import collections
 import contextlib
+import copy
+import functools
 import io
+import re
 import shlex
 import threading
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable, List, Sequence
 
 from yt_dlp import YoutubeDL, parse_options
@@ -25,9 +30,33 @@
     "720p": "bv*[height<=720]+ba/b[height<=720]",
     "480p": "bv*[height<=480]+ba/b[height<=480]",
 }
+DEFAULT_FORMAT = "bv*+ba/best"
 
+# Applied over whatever the CLI args asked for; the GUI needs yt-dlp's output
+# routed to the logger and progress reported line by line
+_STATIC_OPT_OVERRIDES = MappingProxyType({
+    "progress_with_newline": True,
+    "quiet": False,
+    "no_warnings": False,
+})
 
-@dataclass
+# URLs never contain whitespace, so commas and any whitespace separate them
+_URL_SPLIT = re.compile(r"[\s,]+")
+
+# parse_options reads these files and resolves relative dates against the clock,
+# so a cached result for args using them would go stale
+_UNCACHEABLE_LONG_OPTS = ("--batch-file", "--config-locations")
+_RELATIVE_DATE = re.compile(r"(?:^|=)(?:now|today|yesterday)(?:-|$)", re.IGNORECASE)
+
+# Resolved once at import so `_build_format` is a plain lookup
+_QUALITY_FORMATS = MappingProxyType({quality: fmt or DEFAULT_FORMAT for quality, fmt in QUALITY_FORMATS.items()})
+_FORMAT_CHOICES = MappingProxyType({
+    "audio": lambda settings: "bestaudio/best",
+    "custom": lambda settings: settings.custom_format.strip() or None,
+})
+
+
+@dataclass(frozen=True, slots=True)
 class DownloadSettings:
     urls: str
     output_dir: str
@@ -39,6 +68,24 @@ class DownloadSettings:
     advanced_options: str
 
 
+class _TailBuffer(io.TextIOBase):
+    """Text sink that only keeps the last few writes, for error messages"""
+
+    def __init__(self, max_writes: int = 64):
+        super().__init__()
+        self._chunks: collections.deque[str] = collections.deque(maxlen=max_writes)
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self._chunks.append(s)
+        return len(s)
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+
 class UILogger:
     def __init__(self, callback: LogCallback):
         self._callback = callback
@@ -58,51 +105,72 @@ def error(self, msg):
 
 
 def _build_format(settings: DownloadSettings) -> str | None:
-    if settings.format_choice == "audio":
-        return "bestaudio/best"
-    if settings.format_choice == "custom":
-        return settings.custom_format.strip() or None
+    format_builder = _FORMAT_CHOICES.get(settings.format_choice)
+    if format_builder is not None:
+        return format_builder(settings)
+    return _QUALITY_FORMATS.get(settings.quality, DEFAULT_FORMAT)
 
-    quality_fmt = QUALITY_FORMATS.get(settings.quality)
-    return quality_fmt or "bv*+ba/best"
 
-
-def summarize_progress(status: dict) -> dict:
+def summarize_progress(status: dict, into: dict | None = None) -> dict:
+    """Summarize a yt-dlp progress status, optionally reusing the `into` dict"""
     total = status.get("total_bytes") or status.get("total_bytes_estimate") or 0
     downloaded = status.get("downloaded_bytes") or 0
     percent = None
     if total:
         percent = max(0.0, min(100.0, downloaded / total * 100))
 
-    return {
-        "status": status.get("status"),
-        "filename": status.get("filename") or status.get("info_dict", {}).get("title"),
-        "percent": percent,
-        "speed": status.get("speed"),
-        "eta": status.get("eta"),
-    }
+    summary = {} if into is None else into
+    summary["status"] = status.get("status")
+    summary["filename"] = status.get("filename") or status.get("info_dict", {}).get("title")
+    summary["percent"] = percent
+    summary["speed"] = status.get("speed")
+    summary["eta"] = status.get("eta")
+    return summary
 
 
-def _parse_cli_args(urls: Sequence[str], settings: DownloadSettings) -> tuple[List[str], List[str]]:
+@functools.lru_cache(maxsize=64)
+def _split_advanced(advanced_options: str) -> tuple[str, ...]:
+    try:
+        return tuple(shlex.split(advanced_options))
+    except ValueError as err:
+        raise ValueError(f"Advanced options error: {err}") from err
+
+
+@functools.lru_cache(maxsize=32)
+def _args_template(
+    output_dir: str,
+    fmt: str | None,
+    subtitles: bool,
+    embed_metadata: bool,
+    advanced_options: str,
+) -> tuple[str, ...]:
     args: List[str] = []
-    if settings.output_dir:
-        args.extend(["-P", settings.output_dir])
+    if output_dir:
+        args.extend(["-P", output_dir])
 
-    fmt = _build_format(settings)
     if fmt:
         args.extend(["-f", fmt])
 
-    if settings.subtitles:
+    if subtitles:
         args.extend(["--write-subs", "--sub-langs", "all"])
 
-    if settings.embed_metadata:
+    if embed_metadata:
         args.extend(["--add-metadata", "--embed-thumbnail"])
 
-    if settings.advanced_options:
-        try:
-            args.extend(shlex.split(settings.advanced_options))
-        except ValueError as err:
-            raise ValueError(f"Advanced options error: {err}") from err
+    if advanced_options:
+        args.extend(_split_advanced(advanced_options))
+
+    return tuple(args)
+
+
+def _parse_cli_args(urls: Sequence[str], settings: DownloadSettings) -> tuple[List[str], List[str]]:
+    args = list(_args_template(
+        settings.output_dir,
+        _build_format(settings),
+        settings.subtitles,
+        settings.embed_metadata,
+        settings.advanced_options,
+    ))
 
     parsed_urls = [url for url in urls if url]
     if not parsed_urls:
@@ -111,6 +179,41 @@ def _parse_cli_args(urls: Sequence[str], settings: DownloadSettings) -> tuple[Li
     return args, parsed_urls
 
 
+def _is_cacheable(args: Sequence[str]) -> bool:
+    for arg in args:
+        if _RELATIVE_DATE.search(arg):
+            return False
+        if arg.startswith("--"):
+            # optparse also accepts unambiguous prefixes of long options
+            name = arg.partition("=")[0]
+            if len(name) > 2 and any(opt.startswith(name) for opt in _UNCACHEABLE_LONG_OPTS):
+                return False
+        elif arg.startswith("-") and "a" in arg[1:]:
+            # `-a` may be bundled with other short flags, e.g. `-ia FILE`
+            return False
+    return True
+
+
+def _parse_args(args: tuple[str, ...]) -> tuple[tuple[str, ...], dict]:
+    cli_output = _TailBuffer()
+    try:
+        with contextlib.redirect_stdout(cli_output), contextlib.redirect_stderr(cli_output):
+            _, _, urls, ydl_opts = parse_options(list(args))
+    except SystemExit as exc:
+        raise ValueError(cli_output.getvalue().strip() or str(exc)) from exc
+    except Exception as exc:
+        raise ValueError(f"Unable to parse options: {exc}") from exc
+    ydl_opts.update(_STATIC_OPT_OVERRIDES)
+    return tuple(urls), ydl_opts
+
+
+# Keyed on the CLI args without the URLs, so repeated runs with the same settings
+# skip re-parsing. Only used for args that pass `_is_cacheable`.
+@functools.lru_cache(maxsize=32)
+def _cached_parse(args: tuple[str, ...]) -> tuple[tuple[str, ...], dict]:
+    return _parse_args(args)
+
+
 def build_ydl_options(
     urls: Sequence[str],
     settings: DownloadSettings,
@@ -120,30 +223,32 @@ def build_ydl_options(
     cancel_event: threading.Event,
 ):
     args, parsed_urls = _parse_cli_args(urls, settings)
-    cli_output = io.StringIO()
-    try:
-        with contextlib.redirect_stdout(cli_output), contextlib.redirect_stderr(cli_output):
-            _, _, parsed_urls, ydl_opts = parse_options([*args, *parsed_urls])
-    except SystemExit as exc:
-        raise ValueError(cli_output.getvalue().strip() or str(exc)) from exc
-    except Exception as exc:
-        raise ValueError(f"Unable to parse options: {exc}") from exc
+    if _is_cacheable(args):
+        extra_urls, cached_opts = _cached_parse(tuple(args))
+        # YoutubeDL mutates its params in place, so never hand out the cached dict
+        ydl_opts = copy.deepcopy(cached_opts)
+    else:
+        extra_urls, ydl_opts = _parse_args(tuple(args))
+    parsed_urls = [*extra_urls, *parsed_urls]
+
+    is_cancelled = cancel_event.is_set
 
     def hook(status):
-        if cancel_event.is_set():
+        if is_cancelled():
             raise DownloadCancelled("Cancelled")
         progress_callback(status)
 
     ydl_opts["logger"] = UILogger(log_callback)
     ydl_opts["progress_hooks"] = [hook]
-    ydl_opts["progress_with_newline"] = True
-    ydl_opts["quiet"] = False
-    ydl_opts["no_warnings"] = False
 
     status_callback("Preparing download…")
     return parsed_urls, ydl_opts
 
 
+def _split_urls(text: str) -> List[str]:
+    return [url for url in _URL_SPLIT.split(text) if url]
+
+
 def execute_download(
     settings: DownloadSettings,
     log_callback: LogCallback,
@@ -151,30 +256,41 @@ def execute_download(
     status_callback: StatusCallback,
     cancel_event: threading.Event,
 ):
-    urls = [u.strip() for u in settings.urls.replace(",", "\n").splitlines() if u.strip()]
+    urls = _split_urls(settings.urls)
     parsed_urls, ydl_opts = build_ydl_options(urls, settings, log_callback, progress_callback, status_callback, cancel_event)
     with YoutubeDL(ydl_opts) as ydl:
         ydl.download(parsed_urls)
 
 
-def run_download(
+def download_to_completion(
     settings: DownloadSettings,
     log_callback: LogCallback,
     progress_callback: ProgressCallback,
     status_callback: StatusCallback,
     completion_callback: CompletionCallback,
+    cancel_event: threading.Event,
 ):
-    cancel_event = threading.Event()
+    try:
+        execute_download(settings, log_callback, progress_callback, status_callback, cancel_event)
+        completion_callback(True, "Completed")
+    except DownloadCancelled:
+        completion_callback(False, "Cancelled")
+    except Exception as exc:  # noqa: BLE001
+        completion_callback(False, str(exc))
 
-    def _thread():
-        try:
-            execute_download(settings, log_callback, progress_callback, status_callback, cancel_event)
-            completion_callback(True, "Completed")
-        except DownloadCancelled:
-            completion_callback(False, "Cancelled")
-        except Exception as exc:  # noqa: BLE001
-            completion_callback(False, str(exc))
 
-    thread = threading.Thread(target=_thread, daemon=True)
+def run_download(
+    settings: DownloadSettings,
+    log_callback: LogCallback,
+    progress_callback: ProgressCallback,
+    status_callback: StatusCallback,
+    completion_callback: CompletionCallback,
+):
+    cancel_event = threading.Event()
+    thread = threading.Thread(
+        target=download_to_completion,
+        args=(settings, log_callback, progress_callback, status_callback, completion_callback, cancel_event),
+        daemon=True,
+    )
     thread.start()
     return cancel_event, thread
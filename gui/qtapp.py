@@ -2,10 +2,9 @@
 
 import sys
 import threading
-import time
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Qt, Signal
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QThread, QTimer, Qt, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
@@ -23,40 +22,60 @@
     QWidget,
 )
 
-from yt_dlp.utils import DownloadCancelled
+from .downloader import DownloadSettings, download_to_completion, summarize_progress
+from .utils import format_eta, format_speed, log_timestamp
 
-from .downloader import DownloadSettings, execute_download, summarize_progress
-from .utils import format_eta, format_speed
+
+class ProgressEvent(QEvent):
+    TYPE = QEvent.Type(QEvent.registerEventType())
+
+    def __init__(self):
+        super().__init__(ProgressEvent.TYPE)
 
 
 class DownloadThread(QThread):
     log = Signal(str)
-    progress = Signal(dict)
     status = Signal(str)
     completed = Signal(bool, str)
 
-    def __init__(self, settings: DownloadSettings):
+    def __init__(self, settings: DownloadSettings, progress_receiver: QObject):
         super().__init__()
         self.settings = settings
         self.cancel_event = threading.Event()
+        # Progress hooks can fire thousands of times per second; only the
+        # latest raw status is kept, and a single ProgressEvent is posted to
+        # the receiver until it takes that status
+        self._progress_receiver = progress_receiver
+        self._progress_lock = threading.Lock()
+        self._latest_progress: dict | None = None
+        self._progress_posted = False
 
     def cancel(self):
         self.cancel_event.set()
 
+    def take_progress(self) -> dict | None:
+        with self._progress_lock:
+            data, self._latest_progress = self._latest_progress, None
+            self._progress_posted = False
+        return data
+
+    def _store_progress(self, status: dict):
+        with self._progress_lock:
+            self._latest_progress = status
+            if self._progress_posted:
+                return
+            self._progress_posted = True
+        QCoreApplication.postEvent(self._progress_receiver, ProgressEvent())
+
     def run(self):
-        try:
-            execute_download(
-                self.settings,
-                log_callback=self.log.emit,
-                progress_callback=lambda status: self.progress.emit(summarize_progress(status)),
-                status_callback=self.status.emit,
-                cancel_event=self.cancel_event,
-            )
-            self.completed.emit(True, "Completed")
-        except DownloadCancelled:
-            self.completed.emit(False, "Cancelled")
-        except Exception as exc:  # noqa: BLE001
-            self.completed.emit(False, str(exc))
+        download_to_completion(
+            self.settings,
+            log_callback=self.log.emit,
+            progress_callback=self._store_progress,
+            status_callback=self.status.emit,
+            completion_callback=self.completed.emit,
+            cancel_event=self.cancel_event,
+        )
 
 
 class MainWindow(QMainWindow):
@@ -64,6 +83,13 @@ def __init__(self):
         super().__init__()
         self.setWindowTitle("yt-dlp GUI")
         self._thread: DownloadThread | None = None
+        self._last_progress_view: tuple | None = None
+        self._progress_summary: dict = {}
+        # Limits repaints to 10 Hz; progress arriving meanwhile is applied when it fires
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(100)
+        self._progress_timer.timeout.connect(self._apply_progress)
         self._build_ui()
 
     def _build_ui(self):
@@ -157,7 +183,7 @@ def _on_format_change(self, index: int):
         self.quality_combo.setEnabled(self.format_combo.currentText() != "Audio only")
 
     def _append_log(self, message: str):
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = log_timestamp()
         self.log_output.appendPlainText(f"[{timestamp}] {message}")
         self.log_output.verticalScrollBar().setValue(self.log_output.verticalScrollBar().maximum())
 
@@ -180,11 +206,11 @@ def _start_download(self):
             advanced_options=self.advanced_input.toPlainText().strip().replace("\n", " "),
         )
 
-        self._thread = DownloadThread(settings)
+        self._thread = DownloadThread(settings, progress_receiver=self)
         self._thread.log.connect(self._append_log)
-        self._thread.progress.connect(self._update_progress)
         self._thread.status.connect(self._update_status)
         self._thread.completed.connect(self._download_done)
+        self._last_progress_view = None
         self._set_running(True)
         self._thread.start()
 
@@ -201,27 +227,51 @@ def _set_running(self, running: bool):
     def _update_status(self, text: str):
         self.status_label.setText(text)
 
+    def customEvent(self, event: QEvent):
+        if event.type() != ProgressEvent.TYPE:
+            return super().customEvent(event)
+        if not self._progress_timer.isActive():
+            self._apply_progress()
+
+    def _apply_progress(self):
+        if self._poll_progress():
+            self._progress_timer.start()
+
+    def _poll_progress(self) -> bool:
+        status = self._thread.take_progress() if self._thread else None
+        if status is None:
+            return False
+        self._update_progress(summarize_progress(status, into=self._progress_summary))
+        return True
+
     def _update_progress(self, data: dict):
+        percent = data.get("percent")
+        speed_text = format_speed(data.get("speed"))
+        eta_text = format_eta(data.get("eta"))
+        view = (data.get("status"), None if percent is None else int(percent), speed_text, eta_text)
+        if view == self._last_progress_view:
+            return
+        self._last_progress_view = view
+
         if data.get("status") == "finished":
             self.progress_bar.setValue(100)
             self.status_label.setText("Post-processing")
             return
 
-        percent = data.get("percent")
         if percent is None:
             self.progress_bar.setRange(0, 0)
         else:
             self.progress_bar.setRange(0, 100)
             self.progress_bar.setValue(int(percent))
 
-        speed_text = format_speed(data.get("speed"))
-        eta_text = format_eta(data.get("eta"))
         self.speed_label.setText(f"Speed: {speed_text}" if speed_text else "")
         self.eta_label.setText(f"ETA: {eta_text}" if eta_text else "")
         if data.get("status"):
             self.status_label.setText(data["status"].capitalize())
 
     def _download_done(self, success: bool, message: str):
+        self._progress_timer.stop()
+        self._poll_progress()
         self._append_log(message)
         self._set_running(False)
         self.progress_bar.setRange(0, 100)
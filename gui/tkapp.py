@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 import queue
+import socket
 import threading
-import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 
 from .downloader import DownloadSettings, run_download, summarize_progress
-from .utils import format_eta, format_speed
+from .utils import format_eta, format_speed, log_timestamp
 
 
 class TkGui(tk.Tk):
@@ -19,8 +20,41 @@ def __init__(self):
         self.queue: queue.Queue = queue.Queue()
         self.cancel_event: threading.Event | None = None
         self.worker: threading.Thread | None = None
+        self._last_progress_view: tuple | None = None
+        self._progress_summary: dict = {}
+        self._wake_reader: socket.socket | None = None
+        self._wake_writer: socket.socket | None = None
+        self._wake_pending = False
+        self._drain_paused = False
         self._build_ui()
-        self.after(100, self._process_queue)
+        self._setup_queue_wakeup()
+
+    def _setup_queue_wakeup(self):
+        # Workers wake the event loop through a socketpair instead of the
+        # queue being polled; Tk on Windows has no file handlers, so poll there
+        if not hasattr(self.tk, "createfilehandler"):
+            self.after(100, self._poll_queue)
+            return
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self.tk.createfilehandler(self._wake_reader.fileno(), tk.READABLE, self._on_queue_wakeup)
+
+    def destroy(self):
+        if self._wake_reader is not None:
+            self.tk.deletefilehandler(self._wake_reader.fileno())
+            self._wake_reader.close()
+            self._wake_writer.close()
+            self._wake_reader = None
+        super().destroy()
+
+    def _post_event(self, item: tuple):
+        # Called from the worker thread; only one wake-up is outstanding at a time
+        self.queue.put(item)
+        if self._wake_writer is not None and not self._wake_pending:
+            self._wake_pending = True
+            with contextlib.suppress(OSError):
+                self._wake_writer.send(b"\0")
 
     def _build_ui(self):
         main = ttk.Frame(self, padding=12)
@@ -106,10 +140,16 @@ def _choose_folder(self):
         if folder:
             self.output_var.set(folder)
 
+    @staticmethod
+    def _format_log_line(text: str) -> str:
+        return f"[{log_timestamp()}] {text}\n"
+
     def _append_log(self, text: str):
-        timestamp = time.strftime("%H:%M:%S")
+        self._insert_log(self._format_log_line(text))
+
+    def _insert_log(self, lines: str):
         self.log.configure(state="normal")
-        self.log.insert(tk.END, f"[{timestamp}] {text}\n")
+        self.log.insert(tk.END, lines)
         self.log.see(tk.END)
         self.log.configure(state="disabled")
 
@@ -133,11 +173,12 @@ def _start_download(self):
 
         self.cancel_event, self.worker = run_download(
             settings,
-            log_callback=lambda msg: self.queue.put(("log", msg)),
-            progress_callback=lambda info: self.queue.put(("progress", summarize_progress(info))),
-            status_callback=lambda msg: self.queue.put(("status", msg)),
-            completion_callback=lambda success, msg: self.queue.put(("complete", success, msg)),
+            log_callback=lambda msg: self._post_event(("log", self._format_log_line(msg))),
+            progress_callback=lambda info: self._post_event(("progress", info)),
+            status_callback=lambda msg: self._post_event(("status", msg)),
+            completion_callback=lambda success, msg: self._post_event(("complete", success, msg)),
         )
+        self._last_progress_view = None
         self._set_running(True)
 
     def _cancel_download(self):
@@ -150,22 +191,63 @@ def _set_running(self, running: bool):
         self.cancel_btn.configure(state="normal" if running else "disabled")
 
     def _process_queue(self):
+        # Preformatted log lines are inserted in one go and only the newest progress is shown;
+        # anything else flushes what has been collected so far to keep ordering
+        logs: list[str] = []
+        progress = None
         try:
             while True:
                 item = self.queue.get_nowait()
-                self._handle_event(item)
+                if item[0] == "log":
+                    logs.append(item[1])
+                elif item[0] == "progress":
+                    progress = item[1]
+                else:
+                    self._flush_events(logs, progress)
+                    logs, progress = [], None
+                    self._handle_event(item)
         except queue.Empty:
             pass
-        self.after(100, self._process_queue)
+        self._flush_events(logs, progress)
+
+    def _poll_queue(self):
+        self._process_queue()
+        self.after(100, self._poll_queue)
+
+    def _on_queue_wakeup(self, fileno, mask):
+        with contextlib.suppress(BlockingIOError):
+            self._wake_reader.recv(64)
+        if not self._drain_paused:
+            self._drain_queue()
+
+    def _drain_queue(self):
+        self._wake_pending = False
+        self._process_queue()
+        # Let a burst of events pile up for 100 ms so they are coalesced
+        self._drain_paused = True
+        self.after(100, self._resume_drain)
+
+    def _resume_drain(self):
+        self._drain_paused = False
+        # Events queued while paused may not have sent a wake-up
+        self._wake_pending = False
+        if not self.queue.empty():
+            self._drain_queue()
+
+    def _flush_events(self, logs: list[str], progress: dict | None):
+        if logs:
+            self._insert_log("".join(logs))
+        if progress is not None:
+            self._update_progress(summarize_progress(progress, into=self._progress_summary))
 
     def _handle_event(self, item):
         kind = item[0]
         if kind == "log":
-            self._append_log(item[1])
+            self._insert_log(item[1])
         elif kind == "status":
             self.status_label.configure(text=item[1])
         elif kind == "progress":
-            self._update_progress(item[1])
+            self._update_progress(summarize_progress(item[1], into=self._progress_summary))
         elif kind == "complete":
             _, success, msg = item
             self._append_log(msg)
@@ -181,7 +263,16 @@ def _handle_event(self, item):
             self._append_log(str(item))
 
     def _update_progress(self, data: dict):
+        # Skip the Tcl round-trips (and restarting the indeterminate animation)
+        # unless something visible changed, at whole-percent granularity
         percent = data.get("percent")
+        speed_text = format_speed(data.get("speed"))
+        eta_text = format_eta(data.get("eta"))
+        view = (data.get("status"), None if percent is None else int(percent), speed_text, eta_text)
+        if view == self._last_progress_view:
+            return
+        self._last_progress_view = view
+
         if percent is None:
             self.progress.configure(mode="indeterminate")
             self.progress.start(10)
@@ -190,8 +281,8 @@ def _update_progress(self, data: dict):
                 self.progress.stop()
                 self.progress.configure(mode="determinate")
             self.progress["value"] = percent
-        self.speed_label.configure(text=f"Speed: {format_speed(data.get('speed'))}" if data.get("speed") else "")
-        self.eta_label.configure(text=f"ETA: {format_eta(data.get('eta'))}" if data.get("eta") else "")
+        self.speed_label.configure(text=f"Speed: {speed_text}" if speed_text else "")
+        self.eta_label.configure(text=f"ETA: {eta_text}" if eta_text else "")
         if data.get("status"):
             self.status_label.configure(text=data["status"].capitalize())
 
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import functools
+import time
+
+_last_timestamp: tuple[int, str] = (0, "")
+
 
 def format_speed(speed: float | None) -> str:
     if not speed:
@@ -16,9 +21,24 @@ def format_speed(speed: float | None) -> str:
 def format_eta(eta: float | int | None) -> str:
     if eta in (None, 0):
         return ""
-    eta = int(eta)
+    return _format_eta_seconds(int(eta))
+
+
+# ETAs are whole seconds and repeat across ticks, unlike speeds which are
+# arbitrary floats and would never hit a cache without changing the output
+@functools.lru_cache(maxsize=1024)
+def _format_eta_seconds(eta: int) -> str:
     mins, secs = divmod(eta, 60)
     hours, mins = divmod(mins, 60)
     if hours:
         return f"{hours:d}:{mins:02d}:{secs:02d}"
     return f"{mins:02d}:{secs:02d}"
+
+
+def log_timestamp() -> str:
+    # Log lines arrive in bursts, so only reformat when the second changes
+    global _last_timestamp
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _last_timestamp[1]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import dataclasses
 import threading
 
-from gui.downloader import DownloadSettings, build_ydl_options
+import pytest
+
+from gui.downloader import DownloadSettings, _build_format, _cached_parse, _split_urls, build_ydl_options, summarize_progress
+from yt_dlp.version import __version__ as yt_dlp_version
 
 
 def test_build_options_with_metadata(tmp_path):
@@ -31,4 +35,137 @@ def test_build_options_with_metadata(tmp_path):
     assert opts["writesubtitles"] is True
     assert opts["ratelimit"] == 10240
     assert opts["paths"]["home"] == str(tmp_path)
+    assert opts["quiet"] is False
+    assert opts["progress_with_newline"] is True
     assert any(pp.get("key") == "FFmpegMetadata" for pp in opts.get("postprocessors", []))
+
+
+def test_build_format_choices():
+    settings = DownloadSettings(
+        urls="",
+        output_dir="",
+        format_choice="best",
+        custom_format="  ",
+        quality="720p",
+        subtitles=False,
+        embed_metadata=False,
+        advanced_options="",
+    )
+
+    assert _build_format(settings) == "bv*[height<=720]+ba/b[height<=720]"
+    assert _build_format(dataclasses.replace(settings, quality="Best available")) == "bv*+ba/best"
+    assert _build_format(dataclasses.replace(settings, quality="unknown")) == "bv*+ba/best"
+    assert _build_format(dataclasses.replace(settings, format_choice="audio")) == "bestaudio/best"
+    assert _build_format(dataclasses.replace(settings, format_choice="custom")) is None
+
+
+def test_build_options_reuses_parsed_template(tmp_path):
+    settings = DownloadSettings(
+        urls="",
+        output_dir=str(tmp_path),
+        format_choice="best",
+        custom_format="",
+        quality="1080p",
+        subtitles=False,
+        embed_metadata=False,
+        advanced_options="",
+    )
+    kwargs = dict(
+        log_callback=lambda msg: None,
+        progress_callback=lambda info: None,
+        status_callback=lambda msg: None,
+        cancel_event=threading.Event(),
+    )
+
+    first_urls, first_opts = build_ydl_options(["https://example.com/a"], settings, **kwargs)
+    first_opts["paths"]["home"] = "changed"
+    hits = _cached_parse.cache_info().hits
+    second_urls, second_opts = build_ydl_options(["https://example.com/b"], settings, **kwargs)
+
+    assert _cached_parse.cache_info().hits == hits + 1
+    assert first_urls == ["https://example.com/a"]
+    assert second_urls == ["https://example.com/b"]
+    assert second_opts["paths"]["home"] == str(tmp_path)
+    assert second_opts["logger"] is not first_opts["logger"]
+
+
+def test_summarize_progress_reuses_record():
+    record = {}
+    status = {"status": "downloading", "downloaded_bytes": 50, "total_bytes": 200, "info_dict": {"title": "t"}}
+
+    summary = summarize_progress(status, into=record)
+
+    assert summary is record
+    assert summary == {"status": "downloading", "filename": "t", "percent": 25.0, "speed": None, "eta": None}
+    assert summarize_progress({"status": "finished"})["percent"] is None
+
+
+@pytest.mark.parametrize("advanced_options, error", [
+    ("--bogus", "error: no such option: --bogus"),
+    ("--limit-rate abc", 'error: invalid rate limit "abc" given'),
+])
+def test_build_options_reports_parse_errors(tmp_path, advanced_options, error):
+    settings = DownloadSettings(
+        urls="",
+        output_dir=str(tmp_path),
+        format_choice="best",
+        custom_format="",
+        quality="Best available",
+        subtitles=False,
+        embed_metadata=False,
+        advanced_options=advanced_options,
+    )
+
+    with pytest.raises(ValueError) as exc_info:
+        build_ydl_options(
+            ["https://example.com/video"],
+            settings,
+            log_callback=lambda msg: None,
+            progress_callback=lambda info: None,
+            status_callback=lambda msg: None,
+            cancel_event=threading.Event(),
+        )
+
+    message = str(exc_info.value)
+    assert "Usage:" in message
+    assert error in message
+
+
+def test_parse_output_is_captured_on_exit():
+    with pytest.raises(ValueError) as exc_info:
+        _cached_parse(("--version",))
+
+    assert str(exc_info.value).strip() == yt_dlp_version
+
+
+def test_build_options_rereads_batch_file(tmp_path):
+    batch_file = tmp_path / "batch.txt"
+    batch_file.write_text("https://example.com/old\n")
+    settings = DownloadSettings(
+        urls="",
+        output_dir=str(tmp_path),
+        format_choice="best",
+        custom_format="",
+        quality="Best available",
+        subtitles=False,
+        embed_metadata=False,
+        advanced_options=f"-a {batch_file}",
+    )
+    kwargs = dict(
+        log_callback=lambda msg: None,
+        progress_callback=lambda info: None,
+        status_callback=lambda msg: None,
+        cancel_event=threading.Event(),
+    )
+
+    first_urls, _ = build_ydl_options(["https://example.com/a"], settings, **kwargs)
+    batch_file.write_text("https://example.com/new\n")
+    second_urls, _ = build_ydl_options(["https://example.com/a"], settings, **kwargs)
+
+    assert first_urls == ["https://example.com/old", "https://example.com/a"]
+    assert second_urls == ["https://example.com/new", "https://example.com/a"]
+
+
+def test_split_urls():
+    assert _split_urls("a, b\n c  d") == ["a", "b", "c", "d"]
+    assert _split_urls(" ,\n,, ") == []